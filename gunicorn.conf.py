@@ -0,0 +1,77 @@
+# Gunicorn configuration for the game update server
+import io
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+
+# gevent workers multiplex many slow clients (large downloads, uploads) per process.
+# The worker monkey-patches the stdlib before loading server:app, so the
+# connection pool's locks and queues become cooperative.
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gevent')
+workers = int(os.getenv('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+worker_connections = int(os.getenv('GUNICORN_WORKER_CONNECTIONS', 1000))
+
+timeout = 60
+max_requests = 1000
+
+# Workers are forked from the master, so anything it has already imported is shared
+# copy-on-write instead of being loaded again by every worker. Only C extensions with no
+# lock state are preloaded: gevent patches the stdlib in each worker after the fork, and
+# modules such as werkzeug.routing and jinja2 take threading.Lock at import time, so
+# they (and server:app with its connection pool) must be imported after that.
+def on_starting(server):
+    """Import the app's C-extension dependencies once in the master before workers fork"""
+    import sqlite3  # noqa: F401
+    import argon2  # noqa: F401
+    import orjson  # noqa: F401
+
+# gunicorn hands file responses (send_from_directory downloads) to socket.sendfile(), but
+# gevent's socket.sendfile() is always an 8 KiB read()/send() loop because os.sendfile()
+# could block the hub. On gevent's non-blocking sockets it only stops when the send
+# buffer is full, so waiting for writability on EAGAIN keeps the zero-copy path cooperative.
+def _cooperative_sendfile(sock, file, offset=0, count=None):
+    """socket.sendfile() for gevent sockets, yielding to the hub whenever the socket is full"""
+    from gevent.socket import wait_write
+    
+    sock._check_sendfile_params(file, offset, count)
+    try:
+        fileno = file.fileno()
+        file_size = os.fstat(fileno).st_size
+    except (AttributeError, io.UnsupportedOperation, OSError):
+        return sock._sendfile_use_send(file, offset, count)
+    if not file_size:
+        return 0
+    
+    sockno = sock.fileno()
+    blocksize = min(count or file_size, 2 ** 30)
+    total_sent = 0
+    try:
+        while True:
+            if count:
+                blocksize = count - total_sent
+                if blocksize <= 0:
+                    break
+            try:
+                sent = os.sendfile(sockno, fileno, offset, blocksize)
+            except BlockingIOError:
+                wait_write(sockno, timeout=sock.gettimeout())
+                continue
+            except OSError:
+                if total_sent == 0:
+                    return sock._sendfile_use_send(file, offset, count)
+                raise
+            if sent == 0:
+                break  # EOF
+            offset += sent
+            total_sent += sent
+        return total_sent
+    finally:
+        if total_sent > 0 and hasattr(file, 'seek'):
+            file.seek(offset)
+
+def post_worker_init(worker):
+    """Give gevent workers a zero-copy socket.sendfile()"""
+    if worker.__class__.__module__ == 'gunicorn.workers.ggevent' and hasattr(os, 'sendfile'):
+        from gevent import socket as gevent_socket
+        gevent_socket.socket.sendfile = _cooperative_sendfile
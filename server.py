@@ -1,61 +1,260 @@
-from flask import Flask, request, jsonify, send_from_directory, render_template_string, session, redirect, url_for, flash
+from flask import Flask, Response, request, jsonify, send_from_directory, session, redirect, url_for, flash, abort
+from flask.json.provider import DefaultJSONProvider
 import os
-import json
-import zipfile
-from datetime import datetime
+import gzip
+import hashlib
+from datetime import datetime, timezone
 from werkzeug.utils import secure_filename
-from werkzeug.security import generate_password_hash, check_password_hash
-import shutil
+from werkzeug.security import check_password_hash, safe_join
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+import gevent
+from gevent import monkey
+import tempfile
 import sqlite3
+import atexit
+import queue
+import threading
+import time
+from collections import namedtuple
+from contextlib import contextmanager
 from functools import wraps
+from urllib.parse import quote
 from dotenv import load_dotenv
+import orjson
 
 # Load environment variables
 load_dotenv()
 
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that serializes with orjson"""
+    
+    def _options(self, indent=False):
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self._options(kwargs.get('indent'))).decode('utf-8')
+    
+    def dumps_bytes(self, obj):
+        """Serialize obj to compact JSON bytes with a trailing newline, as responses are"""
+        return orjson.dumps(obj, default=self.default, option=self._options() | orjson.OPT_APPEND_NEWLINE)
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # orjson already produces UTF-8 bytes, so skip the str round-trip in dumps()
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        option = self._options(indent) | orjson.OPT_APPEND_NEWLINE
+        return self._app.response_class(orjson.dumps(obj, default=self.default, option=option),
+                                        mimetype=self.mimetype)
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
+# Serve '/admin/' and '/admin' alike instead of answering one of them with a redirect or 404;
+# set before any route is registered, since rules copy it when they are added
+app.url_map.strict_slashes = False
 
 # Configuration - Updated for production
 UPLOAD_FOLDER = 'downloads'
 DATA_FOLDER = 'data'
+# Resolved once at import; handlers use these instead of paths relative to the cwd/app root
+UPLOAD_FOLDER_ABS = os.path.abspath(UPLOAD_FOLDER)
+DATA_FOLDER_ABS = os.path.abspath(DATA_FOLDER)
+DEBUG_MODE = os.getenv('FLASK_DEBUG', 'False').lower() == 'true'
+PORT = int(os.getenv('PORT', 5000))  # Only used by __main__, for gunicorn's --bind or the development server
 BASE_URL = os.getenv('BASE_URL', 'http://localhost:8000')  # Use environment variable
+DOWNLOAD_URL_PREFIX = f"{BASE_URL}/downloads/"  # Prepended to stored download file names
 ALLOWED_EXTENSIONS = {'zip'}
 DB_FILE = os.path.join(DATA_FOLDER, 'users.db')
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', 8))  # Max idle reader connections kept open
+USER_CACHE_TTL = 30  # Seconds a cached login lookup stays valid
+UPLOAD_COPY_BUFFER_SIZE = 1024 * 1024  # Bytes per read/write when copying an upload to disk
+VERSION_CACHE_MAX_AGE = 30  # Seconds clients/CDNs may reuse version info before revalidating
+# When set (e.g. '/_protected/'), downloads are handed to nginx via X-Accel-Redirect
+ACCEL_REDIRECT_PREFIX = os.getenv('ACCEL_REDIRECT_PREFIX', '')
 
 # Flask app configuration - Updated for production
 app.config['MAX_CONTENT_LENGTH'] = int(os.getenv('MAX_CONTENT_LENGTH', 5 * 1024 * 1024 * 1024))  # 5GB default
 app.secret_key = os.getenv('FLASK_SECRET_KEY', 'dev-key-change-in-production')  # Use environment variable
+# Behind Apache mod_xsendfile (or lighttpd), send_from_directory() returns only an X-Sendfile header
+app.config['USE_X_SENDFILE'] = os.getenv('USE_X_SENDFILE', 'False').lower() == 'true'
 
 # Ensure directories exist
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 os.makedirs(DATA_FOLDER, exist_ok=True)
 
+def _configure_connection(conn):
+    """Apply server-tuned PRAGMAs to a freshly opened SQLite connection"""
+    conn.execute('PRAGMA journal_mode=WAL')  # Readers don't block on the writer
+    conn.execute('PRAGMA synchronous=NORMAL')  # Safe with WAL, no fsync per commit
+    conn.execute('PRAGMA busy_timeout=5000')
+    conn.execute('PRAGMA cache_size=-65536')  # 64MB page cache per connection
+    conn.execute('PRAGMA mmap_size=268435456')  # Read up to 256MB through mmap instead of pread()
+    conn.execute('PRAGMA foreign_keys=ON')
+    conn.execute('PRAGMA temp_store=MEMORY')
+    return conn
+
+class ConnectionPool:
+    """Thread-safe SQLite connection pool with one writer and N reader connections"""
+    
+    def __init__(self, db_file, max_readers=DB_POOL_SIZE):
+        self.db_file = db_file
+        self._readers = queue.Queue(maxsize=max_readers)
+        self._writer_conn = None
+        self._writer_lock = threading.Lock()
+    
+    def _connect(self):
+        conn = sqlite3.connect(self.db_file, check_same_thread=False, isolation_level=None)
+        return _configure_connection(conn)
+    
+    def acquire(self):
+        """Take an idle reader connection, opening a new one if none is available"""
+        try:
+            return self._readers.get_nowait()
+        except queue.Empty:
+            return self._connect()
+    
+    def release(self, conn):
+        """Return a reader connection to the pool, closing it if the pool is full"""
+        try:
+            self._readers.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+    
+    @contextmanager
+    def reader(self):
+        """Yield a cursor on a pooled reader connection"""
+        conn = self.acquire()
+        cursor = conn.cursor()
+        try:
+            yield cursor
+        finally:
+            cursor.close()
+            self.release(conn)
+    
+    @contextmanager
+    def writer(self):
+        """Yield a cursor inside a write transaction on the single writer connection"""
+        with self._writer_lock:
+            if self._writer_conn is None:
+                self._writer_conn = self._connect()
+            cursor = self._writer_conn.cursor()
+            # Take the write lock up-front so the transaction never has to upgrade
+            cursor.execute('BEGIN IMMEDIATE')
+            try:
+                yield cursor
+                cursor.execute('COMMIT')
+            except BaseException:
+                cursor.execute('ROLLBACK')
+                raise
+            finally:
+                cursor.close()
+    
+    def close(self):
+        """Checkpoint the WAL if this process wrote to it, then close all connections"""
+        with self._writer_lock:
+            conn = self._writer_conn
+            self._writer_conn = None
+            if conn is not None:
+                try:
+                    # Fold what can be copied without waiting back into the database file;
+                    # PASSIVE never blocks on readers in other workers during recycling
+                    conn.execute('PRAGMA wal_checkpoint(PASSIVE)')
+                except sqlite3.Error:
+                    pass  # The last connection to close checkpoints anyway
+                finally:
+                    conn.close()
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+
+db_pool = ConnectionPool(DB_FILE)
+atexit.register(db_pool.close)
+
+# Schema DDL, applied in a single transaction by init_database()
+SCHEMA_SQL = (
+    '''
+    CREATE TABLE IF NOT EXISTS users (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        username TEXT UNIQUE NOT NULL,
+        password_hash TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        is_admin BOOLEAN DEFAULT TRUE
+    )
+    ''',
+    # Explicit index so login lookups are a visible B-tree probe in EXPLAIN QUERY PLAN
+    'CREATE UNIQUE INDEX IF NOT EXISTS idx_users_username ON users(username)',
+    # Version registry for both game and launcher builds
+    '''
+    CREATE TABLE IF NOT EXISTS versions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        kind TEXT NOT NULL,
+        version TEXT NOT NULL,
+        download_url TEXT NOT NULL,
+        release_notes TEXT NOT NULL DEFAULT '',
+        file_size INTEGER NOT NULL DEFAULT 0,
+        release_date TEXT NOT NULL,
+        is_active BOOLEAN NOT NULL DEFAULT FALSE,
+        sha256 TEXT NOT NULL DEFAULT '',
+        UNIQUE (kind, version)
+    )
+    ''',
+    # Partial index: the active lookup touches a single row, and only one version per kind can be active
+    'CREATE UNIQUE INDEX IF NOT EXISTS idx_versions_active ON versions(kind) WHERE is_active = 1',
+    'CREATE INDEX IF NOT EXISTS idx_versions_release_date ON versions(kind, release_date)',
+    # Bumped in every transaction that changes a kind's versions, so each worker
+    # can tell whether its in-process copy of the registry is still current
+    '''
+    CREATE TABLE IF NOT EXISTS version_revisions (
+        kind TEXT PRIMARY KEY,
+        revision INTEGER NOT NULL DEFAULT 0
+    )
+    ''',
+)
+
+# Stored in the database's user_version once initialization has run; bump it whenever
+# SCHEMA_SQL or the migrations in init_database() change
+SCHEMA_VERSION = 1
+
 def init_database():
     """Initialize the user database"""
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
+    # Every worker calls this at import; once the schema is current it is a single PRAGMA read
+    with db_pool.reader() as cursor:
+        cursor.execute('PRAGMA user_version')
+        if cursor.fetchone()[0] == SCHEMA_VERSION:
+            return
     
-    # Create users table
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS users (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            username TEXT UNIQUE NOT NULL,
-            password_hash TEXT NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            is_admin BOOLEAN DEFAULT TRUE
-        )
-    ''')
+    # Hashed up front so the slow argon2 call never runs while the write lock is held
+    admin_rows = _hash_users([('admin', 'admin123')])
     
-    # Create default admin user if no users exist
-    cursor.execute('SELECT COUNT(*) FROM users')
-    if cursor.fetchone()[0] == 0:
-        default_password = generate_password_hash('admin123')
-        cursor.execute('INSERT INTO users (username, password_hash) VALUES (?, ?)', 
-                      ('admin', default_password))
-        print("🔑 Default admin user created: admin/admin123")
-    
-    conn.commit()
-    conn.close()
+    # Everything runs inside the writer's BEGIN IMMEDIATE transaction; executescript()
+    # is avoided because it implicitly commits any open transaction first
+    with db_pool.writer() as cursor:
+        for statement in SCHEMA_SQL:
+            cursor.execute(statement)
+        
+        # Databases created before uploads were hashed lack the sha256 column
+        cursor.execute('PRAGMA table_info(versions)')
+        if 'sha256' not in {column[1] for column in cursor.fetchall()}:
+            cursor.execute("ALTER TABLE versions ADD COLUMN sha256 TEXT NOT NULL DEFAULT ''")
+        
+        # Create default admin user if no users exist
+        cursor.execute('SELECT COUNT(*) FROM users')
+        if cursor.fetchone()[0] == 0:
+            _insert_users(cursor, admin_rows)
+            print("🔑 Default admin user created: admin/admin123")
+        
+        _import_legacy_versions(cursor)
+        cursor.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
 
 def login_required(f):
     """Decorator to require login for admin routes"""
@@ -66,148 +265,397 @@ def login_required(f):
         return f(*args, **kwargs)
     return decorated_function
 
+# argon2id hasher used for all new password hashes
+_password_hasher = PasswordHasher(time_cost=2, memory_cost=64 * 1024, parallelism=2)
+
+def _run_off_hub(func, *args):
+    """Run a slow blocking call on gevent's threadpool in gevent workers, inline otherwise"""
+    # Password hashing takes ~0.1s in C with the GIL released; on the hub it would
+    # stall every other request in the worker for that long
+    if monkey.is_module_patched('threading'):
+        return gevent.get_hub().threadpool.apply(func, args)
+    return func(*args)
+
+def hash_password(password):
+    """Hash a password with argon2id"""
+    return _run_off_hub(_password_hasher.hash, password)
+
+def _verify_password(password_hash, password):
+    if not password_hash.startswith('$argon2'):
+        return check_password_hash(password_hash, password)
+    try:
+        return _password_hasher.verify(password_hash, password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+def verify_password(password_hash, password):
+    """Check a password against an argon2 hash or a legacy Werkzeug hash"""
+    return _run_off_hub(_verify_password, password_hash, password)
+
+def password_needs_rehash(password_hash):
+    """True for legacy Werkzeug hashes or argon2 hashes with outdated parameters"""
+    return not password_hash.startswith('$argon2') or _password_hasher.check_needs_rehash(password_hash)
+
+# Login lookups keyed by username: {username: (user_id, password_hash, cached_at)}
+_user_cache = {}
+_user_cache_lock = threading.Lock()
+
+def _invalidate_user_cache(username=None, user_id=None):
+    """Drop cached login lookups for a username and/or user ID"""
+    with _user_cache_lock:
+        if username is not None:
+            _user_cache.pop(username, None)
+        if user_id is not None:
+            for name in [n for n, entry in _user_cache.items() if entry[0] == user_id]:
+                del _user_cache[name]
+
 def authenticate_user(username, password):
     """Authenticate user credentials"""
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
+    now = time.monotonic()
+    with _user_cache_lock:
+        cached = _user_cache.get(username)
     
-    cursor.execute('SELECT id, password_hash FROM users WHERE username = ?', (username,))
-    user = cursor.fetchone()
-    conn.close()
+    if cached and now - cached[2] < USER_CACHE_TTL:
+        user = cached[:2]
+    else:
+        with db_pool.reader() as cursor:
+            cursor.execute('SELECT id, password_hash FROM users WHERE username = ?', (username,))
+            user = cursor.fetchone()
+        if user:
+            with _user_cache_lock:
+                _user_cache[username] = (user[0], user[1], now)
     
-    if user and check_password_hash(user[1], password):
+    # The hash check always runs, cached or not
+    if user and verify_password(user[1], password):
+        if password_needs_rehash(user[1]):
+            # Upgrade legacy hashes now that we know the plaintext, hashing before
+            # the write lock is taken so only the UPDATE runs under it
+            new_hash = hash_password(password)
+            with db_pool.writer() as cursor:
+                cursor.execute('UPDATE users SET password_hash = ? WHERE id = ?',
+                              (new_hash, user[0]))
+            _invalidate_user_cache(username=username)
         return user[0]  # Return user ID
     return None
 
 def get_all_users():
     """Get all users from database"""
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    
-    cursor.execute('SELECT id, username, created_at FROM users ORDER BY username')
-    users = cursor.fetchall()
-    conn.close()
+    with db_pool.reader() as cursor:
+        cursor.execute('SELECT id, username, created_at FROM users ORDER BY username')
+        return cursor.fetchall()
+
+def _hash_users(users):
+    """Turn (username, password) pairs into (username, password_hash) rows"""
+    return [(username, hash_password(password)) for username, password in users]
+
+def _insert_users(cursor, rows):
+    """Insert pre-hashed (username, password_hash) rows using the caller's transaction"""
+    cursor.executemany('INSERT INTO users (username, password_hash) VALUES (?, ?)', rows)
+
+def create_users_bulk(users):
+    """Create several users from (username, password) pairs in a single transaction"""
+    # Hash before taking the write lock; argon2 is far slower than the inserts
+    rows = _hash_users(users)
+    try:
+        with db_pool.writer() as cursor:
+            _insert_users(cursor, rows)
+    except sqlite3.IntegrityError:
+        return False  # A username already exists; nothing was inserted
     
-    return users
+    for username, _ in rows:
+        _invalidate_user_cache(username=username)
+    return True
 
 def create_user(username, password):
     """Create a new user"""
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    
-    try:
-        password_hash = generate_password_hash(password)
-        cursor.execute('INSERT INTO users (username, password_hash) VALUES (?, ?)', 
-                      (username, password_hash))
-        conn.commit()
-        conn.close()
-        return True
-    except sqlite3.IntegrityError:
-        conn.close()
-        return False  # Username already exists
+    return create_users_bulk([(username, password)])
 
 def delete_user(user_id):
     """Delete a user"""
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    
-    # Don't allow deleting the last admin user
-    cursor.execute('SELECT COUNT(*) FROM users')
-    user_count = cursor.fetchone()[0]
-    
-    if user_count <= 1:
-        conn.close()
-        return False  # Can't delete last user
-    
-    cursor.execute('DELETE FROM users WHERE id = ?', (user_id,))
-    conn.commit()
-    conn.close()
+    with db_pool.writer() as cursor:
+        # Don't allow deleting the last admin user
+        cursor.execute('SELECT COUNT(*) FROM users')
+        user_count = cursor.fetchone()[0]
+        
+        if user_count <= 1:
+            return False  # Can't delete last user
+        
+        cursor.execute('DELETE FROM users WHERE id = ?', (user_id,))
+    _invalidate_user_cache(user_id=user_id)
     return True
 
-def allowed_file(filename):
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+# Dotted suffixes an upload's file name may end with, e.g. ('.zip',)
+_ALLOWED_SUFFIXES = tuple('.' + ext for ext in ALLOWED_EXTENSIONS)
 
-def load_versions():
-    """Load all versions from the JSON file"""
-    versions_file = os.path.join(DATA_FOLDER, 'versions.json')
-    if not os.path.exists(versions_file):
-        return []
+def _fsync_directory(path):
+    """Flush a directory entry so a rename into it survives a crash (POSIX only)"""
+    if not hasattr(os, 'O_DIRECTORY'):
+        return
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def save_upload(file, filepath):
+    """Atomically store an uploaded file at filepath; returns (bytes written, SHA-256 hex digest)"""
+    # Write to a temp file in the same directory and rename it over the target, so a
+    # crash or a concurrent download never sees a truncated, half-written archive
+    directory = os.path.dirname(filepath)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.part')
+    file_size = 0
+    digest = hashlib.sha256()  # hashed while the chunk is hot, so clients can verify without a re-read
+    try:
+        if hasattr(os, 'fchmod'):
+            os.fchmod(fd, 0o644)  # mkstemp creates 0600; downloads must be readable
+        # 1 MiB chunks are larger than the writer's buffer, so each one goes straight
+        # to a single write() instead of FileStorage.save()'s 16 KiB copy loop
+        with os.fdopen(fd, 'wb') as dst:
+            while True:
+                chunk = file.stream.read(UPLOAD_COPY_BUFFER_SIZE)
+                if not chunk:
+                    break
+                dst.write(chunk)
+                digest.update(chunk)
+                file_size += len(chunk)
+            dst.flush()
+            os.fsync(dst.fileno())
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    _fsync_directory(directory)
+    return file_size, digest.hexdigest()
+
+# Version registry lives in the versions table; kind is 'game' or 'launcher'.
+# These JSON files were the registry before it moved into SQLite.
+LEGACY_VERSION_FILES = {
+    'game': os.path.join(DATA_FOLDER, 'versions.json'),
+    'launcher': os.path.join(DATA_FOLDER, 'launcher_versions.json'),
+}
+
+# Version queries share one column list, built once so each call reuses the
+# connection's cached prepared statement for the identical SQL text
+_VERSION_COLUMNS = 'version, download_url, release_notes, file_size, release_date, is_active, sha256'
+_SELECT_VERSIONS_SQL = f'SELECT {_VERSION_COLUMNS} FROM versions WHERE kind = ? ORDER BY release_date DESC'
+_SELECT_REVISION_SQL = 'SELECT revision FROM version_revisions WHERE kind = ?'
+
+def _row_to_version(row):
+    """Convert a versions row into the dict shape the API returns"""
+    # Display strings are formatted here, once per cache fill, instead of per row in the admin page
+    return {
+        'version': row[0],
+        'download_url': row[1],
+        'release_notes': row[2],
+        'file_size': row[3],
+        'file_size_formatted': format_file_size(row[3]),
+        'release_date': row[4],
+        'release_date_display': format_release_date(row[4]),
+        'is_active': bool(row[5]),
+        'sha256': row[6],
+    }
+
+def _import_legacy_versions(cursor):
+    """Import the legacy JSON registries into an empty versions table"""
+    cursor.execute('SELECT COUNT(*) FROM versions')
+    if cursor.fetchone()[0] > 0:
+        return
     
+    for kind, path in LEGACY_VERSION_FILES.items():
+        try:
+            with open(path, 'rb') as f:
+                versions = orjson.loads(f.read())
+        except (orjson.JSONDecodeError, FileNotFoundError):
+            continue
+        
+        rows = []
+        active_seen = False
+        for v in versions:
+            # Only the first active entry counts, matching the old lookup
+            is_active = bool(v.get('is_active', False)) and not active_seen
+            active_seen = active_seen or is_active
+            rows.append((kind, v['version'], v['download_url'], v.get('release_notes', ''),
+                         v.get('file_size', 0), v.get('release_date', ''), is_active))
+        
+        cursor.executemany('''
+            INSERT OR IGNORE INTO versions
+                (kind, version, download_url, release_notes, file_size, release_date, is_active)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', rows)
+        if rows:
+            _bump_revision(cursor, kind)
+            print(f"📦 Imported {len(rows)} {kind} versions from {path}")
+
+def _bump_revision(cursor, kind):
+    """Mark a kind's versions as changed; call inside the writing transaction"""
+    cursor.execute('''
+        INSERT INTO version_revisions (kind, revision) VALUES (?, 1)
+        ON CONFLICT (kind) DO UPDATE SET revision = revision + 1
+    ''', (kind,))
+
+# Parsed versions of one kind as of a revision; by_version maps version -> row, active is
+# the active row or None, and json_body/etag are the serialized history response
+VersionsSnapshot = namedtuple('VersionsSnapshot', 'revision by_version active json_body etag')
+
+# {kind: VersionsSnapshot}. Rows are shared between requests, so callers must treat them as read-only.
+_versions_cache = {}
+_versions_cache_lock = threading.Lock()
+
+def _versions_snapshot(kind):
+    """Return the VersionsSnapshot for a kind, re-querying only after a write"""
+    with db_pool.reader() as cursor:
+        cursor.execute(_SELECT_REVISION_SQL, (kind,))
+        row = cursor.fetchone()
+        revision = row[0] if row else 0
+        cached = _versions_cache.get(kind)
+        if cached is not None and cached.revision == revision:
+            return cached
+        
+        # After a write, one request refills while concurrent misses wait and reuse its snapshot
+        with _versions_cache_lock:
+            cached = _versions_cache.get(kind)
+            if cached is not None and cached.revision == revision:
+                return cached
+            snapshot = _versions_cache[kind] = _load_versions_snapshot(cursor, kind)
+    return snapshot
+
+def _load_versions_snapshot(cursor, kind):
+    """Query and build a fresh versions snapshot for a kind"""
+    # Re-read the revision with the rows so both come from one snapshot
+    cursor.execute('BEGIN')
     try:
-        with open(versions_file, 'r') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, FileNotFoundError):
-        return []
-
-def save_versions(versions):
-    """Save all versions to the JSON file"""
-    versions_file = os.path.join(DATA_FOLDER, 'versions.json')
-    with open(versions_file, 'w') as f:
-        json.dump(versions, f, indent=2)
-
-def get_active_version():
-    """Get the currently active version"""
-    versions = load_versions()
-    for version in versions:
-        if version.get('is_active', False):
-            return version
-    return None
+        cursor.execute(_SELECT_REVISION_SQL, (kind,))
+        row = cursor.fetchone()
+        cursor.execute(_SELECT_VERSIONS_SQL, (kind,))
+        versions = tuple(_row_to_version(r) for r in cursor.fetchall())
+    finally:
+        cursor.execute('COMMIT')
+    
+    by_version = {v['version']: v for v in versions}
+    active = next((v for v in versions if v['is_active']), None)
+    # History responses are serialized once per change, already sorted newest first
+    json_body = app.json.dumps_bytes(versions)
+    # Hashed from the body rather than the revision, which restarts if the database is recreated
+    etag = hashlib.blake2b(json_body, digest_size=8).hexdigest()
+    return VersionsSnapshot(row[0] if row else 0, by_version, active, json_body, etag)
+
+def load_versions_json(kind='game'):
+    """Load all versions of a kind, newest first, as serialized JSON bytes and their ETag"""
+    snapshot = _versions_snapshot(kind)
+    return snapshot.json_body, snapshot.etag
+
+def get_version(kind, version):
+    """Get a single version of a kind, or None"""
+    return _versions_snapshot(kind).by_version.get(version)
+
+def get_active_version(kind='game'):
+    """Get the currently active version of a kind"""
+    return _versions_snapshot(kind).active
+
+def save_version(kind, version_info):
+    """Insert or replace a version, deactivating the others if it is active"""
+    with db_pool.writer() as cursor:
+        if version_info['is_active']:
+            cursor.execute('UPDATE versions SET is_active = 0 WHERE kind = ? AND is_active = 1', (kind,))
+        cursor.execute('''
+            INSERT INTO versions
+                (kind, version, download_url, release_notes, file_size, release_date, is_active, sha256)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (kind, version) DO UPDATE SET
+                download_url = excluded.download_url,
+                release_notes = excluded.release_notes,
+                file_size = excluded.file_size,
+                release_date = excluded.release_date,
+                is_active = excluded.is_active,
+                sha256 = excluded.sha256
+        ''', (kind, version_info['version'], version_info['download_url'], version_info['release_notes'],
+              version_info['file_size'], version_info['release_date'], version_info['is_active'],
+              version_info['sha256']))
+        _bump_revision(cursor, kind)
+
+def set_active_version(kind, version):
+    """Make a version the active one; returns False if it doesn't exist"""
+    with db_pool.writer() as cursor:
+        cursor.execute('SELECT 1 FROM versions WHERE kind = ? AND version = ?', (kind, version))
+        if cursor.fetchone() is None:
+            return False
+        cursor.execute('UPDATE versions SET is_active = 0 WHERE kind = ? AND is_active = 1', (kind,))
+        cursor.execute('UPDATE versions SET is_active = 1 WHERE kind = ? AND version = ?', (kind, version))
+        _bump_revision(cursor, kind)
+    return True
 
-def get_active_launcher_version():
-    """Get the currently active launcher version"""
-    launcher_versions = load_launcher_versions()
-    for version in launcher_versions:
-        if version.get('is_active', False):
-            return version
-    return None
+def version_etag(version):
+    """ETag for a version record, derived from every field the API exposes"""
+    # DownloadUrl is resolved against BASE_URL, so a new base URL must change the tag too
+    fields = (version['version'], version['download_url'], version['release_notes'],
+              version['file_size'], version['release_date'], version['sha256'], DOWNLOAD_URL_PREFIX)
+    return hashlib.blake2b(repr(fields).encode('utf-8'), digest_size=8).hexdigest()
+
+def remove_version(kind, version):
+    """Delete an inactive version; returns False if nothing was deleted"""
+    with db_pool.writer() as cursor:
+        cursor.execute('DELETE FROM versions WHERE kind = ? AND version = ? AND is_active = 0', (kind, version))
+        if cursor.rowcount == 0:
+            return False
+        _bump_revision(cursor, kind)
+    return True
 
-def load_launcher_versions():
-    """Load all launcher versions from the JSON file"""
-    launcher_file = os.path.join(DATA_FOLDER, 'launcher_versions.json')
-    if not os.path.exists(launcher_file):
-        return []
-    
-    try:
-        with open(launcher_file, 'r') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, FileNotFoundError):
-        return []
+# Stored download URLs are either absolute or a file name under /downloads/
+_ABSOLUTE_URL_PREFIXES = ('http://', 'https://')
 
-def save_launcher_versions(versions):
-    """Save all launcher versions to the JSON file"""
-    launcher_file = os.path.join(DATA_FOLDER, 'launcher_versions.json')
-    with open(launcher_file, 'w') as f:
-        json.dump(versions, f, indent=2)
+def absolute_download_url(download_url):
+    """Resolve a stored download URL against BASE_URL unless it is already absolute"""
+    if download_url.startswith(_ABSOLUTE_URL_PREFIXES):
+        return download_url
+    return DOWNLOAD_URL_PREFIX + download_url
+
+# Size units indexed by power of 1024, i.e. (size_bytes.bit_length() - 1) // 10
+_SIZE_UNITS = ('bytes', 'KB', 'MB', 'GB')
 
 def format_file_size(size_bytes):
     """Format file size in human readable format"""
-    if size_bytes >= 1024**3:
-        return f"{size_bytes / (1024**3):.1f} GB"
-    elif size_bytes >= 1024**2:
-        return f"{size_bytes / (1024**2):.1f} MB"
-    elif size_bytes >= 1024:
-        return f"{size_bytes / 1024:.1f} KB"
-    else:
+    idx = min(max((size_bytes.bit_length() - 1) // 10, 0), 3)
+    if idx == 0:
         return f"{size_bytes} bytes"
+    
+    # Tenths of a unit in integer math, rounded half-to-even like f"{x:.1f}"
+    shift = 10 * idx
+    scaled = size_bytes * 10
+    tenths = scaled >> shift
+    remainder = (scaled & ((1 << shift) - 1)) << 1
+    if remainder > (1 << shift) or (remainder == (1 << shift) and tenths & 1):
+        tenths += 1
+    return f"{tenths // 10}.{tenths % 10} {_SIZE_UNITS[idx]}"
+
+def format_release_date(release_date):
+    """Format an ISO release date as 'YYYY-MM-DD HH:MM UTC', or return it unchanged"""
+    try:
+        parsed = datetime.fromisoformat(release_date)
+    except ValueError:
+        return release_date
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc)
+    return parsed.strftime('%Y-%m-%d %H:%M UTC')
+
+def render_compiled(template, **context):
+    """Render a precompiled template with the same context render_template_string provides"""
+    app.update_template_context(context)
+    return template.render(context)
+
+def html_response(html, gzipped=None):
+    """Build an HTML response, gzip-compressed when the client accepts it"""
+    response = Response(html, mimetype='text/html')
+    response.vary.add('Accept-Encoding')
+    # Quality rather than membership, so "gzip;q=0" counts as a refusal
+    if request.accept_encodings['gzip'] > 0:
+        # Fast level 1 for per-request pages; callers may pass precompressed bytes
+        response.set_data(gzipped if gzipped is not None else gzip.compress(response.get_data(), 1))
+        response.headers['Content-Encoding'] = 'gzip'
+    return response
 
 # Authentication routes
-@app.route('/login', methods=['GET', 'POST'])
-def login():
-    """Login page"""
-    if request.method == 'POST':
-        username = request.form['username']
-        password = request.form['password']
-        
-        user_id = authenticate_user(username, password)
-        if user_id:
-            session['user_id'] = user_id
-            session['username'] = username
-            flash('Login successful!', 'success')
-            return redirect(url_for('admin_interface'))
-        else:
-            flash('Invalid username or password', 'error')
-    
-    login_html = '''
+LOGIN_HTML = '''
 <!DOCTYPE html>
 <html>
 <head>
@@ -258,9 +706,38 @@ def login():
     </div>
 </body>
 </html>
-    '''
+'''
+
+_LOGIN_TEMPLATE = app.jinja_env.from_string(LOGIN_HTML)
+
+# Without pending flash messages the login page is identical for every request,
+# so it is rendered and compressed once: (html, gzipped_html)
+_login_page_cache = None
+
+@app.route('/login', methods=['GET', 'POST'])
+def login():
+    """Login page"""
+    if request.method == 'POST':
+        username = request.form['username']
+        password = request.form['password']
+        
+        user_id = authenticate_user(username, password)
+        if user_id:
+            session['user_id'] = user_id
+            session['username'] = username
+            flash('Login successful!', 'success')
+            return redirect(url_for('admin_interface'))
+        else:
+            flash('Invalid username or password', 'error')
     
-    return render_template_string(login_html)
+    if '_flashes' in session:
+        return html_response(render_compiled(_LOGIN_TEMPLATE))
+    
+    global _login_page_cache
+    if _login_page_cache is None:
+        html = render_compiled(_LOGIN_TEMPLATE)
+        _login_page_cache = (html, gzip.compress(html.encode('utf-8'), 9))
+    return html_response(*_login_page_cache)
 
 @app.route('/logout')
 @login_required
@@ -270,13 +747,7 @@ def logout():
     flash('Logged out successfully!', 'success')
     return redirect(url_for('login'))
 
-@app.route('/admin/users')
-@login_required
-def manage_users():
-    """User management page"""
-    users = get_all_users()
-    
-    user_management_html = '''
+USER_MANAGEMENT_HTML = '''
 <!DOCTYPE html>
 <html>
 <head>
@@ -367,9 +838,17 @@ def manage_users():
     </div>
 </body>
 </html>
-    '''
+'''
+
+_USER_MANAGEMENT_TEMPLATE = app.jinja_env.from_string(USER_MANAGEMENT_HTML)
+
+@app.route('/admin/users')
+@login_required
+def manage_users():
+    """User management page"""
+    users = get_all_users()
     
-    return render_template_string(user_management_html, users=users)
+    return html_response(render_compiled(_USER_MANAGEMENT_TEMPLATE, users=users))
 
 @app.route('/admin/users/create', methods=['POST'])
 @login_required
@@ -401,15 +880,7 @@ def delete_user_route(user_id):
     return redirect(url_for('manage_users'))
 
 # Public launcher download page
-@app.route('/')
-def launcher_download():
-    """Public launcher download page"""
-    try:
-        launcher_version = get_active_launcher_version()
-    except:
-        launcher_version = None
-    
-    download_page_html = '''
+DOWNLOAD_PAGE_HTML = '''
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -818,9 +1289,37 @@ def launcher_download():
     </script>
 </body>
 </html>
-    '''
+'''
+
+_DOWNLOAD_PAGE_TEMPLATE = app.jinja_env.from_string(DOWNLOAD_PAGE_HTML)
+
+@app.route('/')
+def launcher_download():
+    """Public launcher download page"""
+    try:
+        launcher_version = get_active_version('launcher')
+    except:
+        launcher_version = None
     
-    return render_template_string(download_page_html, launcher_version=launcher_version)
+    return html_response(render_compiled(_DOWNLOAD_PAGE_TEMPLATE, launcher_version=launcher_version))
+
+def cacheable_json(etag, build, max_age=VERSION_CACHE_MAX_AGE):
+    """Answer a conditional GET with 304 if the client has etag, else with the JSON from build()"""
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        # build() may also return a ready response, e.g. around pre-serialized JSON
+        response = build()
+        if not isinstance(response, Response):
+            response = jsonify(response)
+    response.set_etag(etag, weak=True)
+    if max_age is None:
+        # Revalidate every time, so admin pages see their own writes immediately
+        response.cache_control.no_cache = True
+    else:
+        response.cache_control.public = True
+        response.cache_control.max_age = max_age
+    return response
 
 # API Routes
 @app.route('/api/version', methods=['GET'])
@@ -832,19 +1331,17 @@ def get_current_version():
         if not active_version:
             return jsonify({'error': 'No active version available'}), 404
         
-        # Ensure download URL is complete
-        download_url = active_version['download_url']
-        if not download_url.startswith('http'):
-            download_url = f"{BASE_URL}/downloads/{download_url}"
-        
-        version_info = {
-            'Version': active_version['version'],
-            'DownloadUrl': download_url,
-            'ReleaseNotes': active_version.get('release_notes', ''),
-            'FileSize': active_version.get('file_size', 0)
-        }
+        def build_version_info():
+            return {
+                'Version': active_version['version'],
+                'DownloadUrl': absolute_download_url(active_version['download_url']),
+                'ReleaseNotes': active_version.get('release_notes', ''),
+                'FileSize': active_version.get('file_size', 0),
+                'Sha256': active_version['sha256']
+            }
         
-        return jsonify(version_info)
+        # Launchers poll this endpoint; unchanged versions answer 304 with no body
+        return cacheable_json(version_etag(active_version), build_version_info)
     
     except Exception as e:
         return jsonify({'error': f'Error retrieving version info: {str(e)}'}), 500
@@ -853,24 +1350,21 @@ def get_current_version():
 def get_launcher_version():
     """Get the current launcher version info"""
     try:
-        launcher_version = get_active_launcher_version()
+        launcher_version = get_active_version('launcher')
         
         if not launcher_version:
             return jsonify({'error': 'No launcher version available'}), 404
         
-        # Ensure download URL is complete
-        download_url = launcher_version['download_url']
-        if not download_url.startswith('http'):
-            download_url = f"{BASE_URL}/downloads/{download_url}"
-        
-        version_info = {
-            'Version': launcher_version['version'],
-            'DownloadUrl': download_url,
-            'ReleaseNotes': launcher_version.get('release_notes', ''),
-            'FileSize': launcher_version.get('file_size', 0)
-        }
+        def build_version_info():
+            return {
+                'Version': launcher_version['version'],
+                'DownloadUrl': absolute_download_url(launcher_version['download_url']),
+                'ReleaseNotes': launcher_version.get('release_notes', ''),
+                'FileSize': launcher_version.get('file_size', 0),
+                'Sha256': launcher_version['sha256']
+            }
         
-        return jsonify(version_info)
+        return cacheable_json(version_etag(launcher_version), build_version_info)
     
     except Exception as e:
         return jsonify({'error': f'Error retrieving launcher version info: {str(e)}'}), 500
@@ -879,10 +1373,9 @@ def get_launcher_version():
 def get_version_history():
     """Get all versions history"""
     try:
-        versions = load_versions()
-        # Sort by release date, newest first
-        versions.sort(key=lambda x: x.get('release_date', ''), reverse=True)
-        return jsonify(versions)
+        # Sorted by release date, newest first
+        body, etag = load_versions_json()
+        return cacheable_json(etag, lambda: app.response_class(body, mimetype=app.json.mimetype), max_age=None)
     except Exception as e:
         return jsonify({'error': f'Error retrieving version history: {str(e)}'}), 500
 
@@ -890,10 +1383,9 @@ def get_version_history():
 def get_launcher_history():
     """Get all launcher versions history"""
     try:
-        launcher_versions = load_launcher_versions()
-        # Sort by release date, newest first
-        launcher_versions.sort(key=lambda x: x.get('release_date', ''), reverse=True)
-        return jsonify(launcher_versions)
+        # Sorted by release date, newest first
+        body, etag = load_versions_json('launcher')
+        return cacheable_json(etag, lambda: app.response_class(body, mimetype=app.json.mimetype), max_age=None)
     except Exception as e:
         return jsonify({'error': f'Error retrieving launcher history: {str(e)}'}), 500
 
@@ -913,10 +1405,14 @@ def upload_game_version():
         if not version:
             return jsonify({'error': 'Version is required'}), 400
         
+        # The version becomes part of the stored file name, so it must not carry path parts
+        if secure_filename(version) != version:
+            return jsonify({'error': 'Version may only contain letters, digits, dots, dashes and underscores'}), 400
+        
         if file.filename == '':
             return jsonify({'error': 'No file selected'}), 400
         
-        if not allowed_file(file.filename):
+        if not file.filename.lower().endswith(_ALLOWED_SUFFIXES):
             return jsonify({'error': 'Only ZIP files are allowed'}), 400
         
         # Create secure filename
@@ -925,13 +1421,10 @@ def upload_game_version():
         else:
             filename = f"game-v{version}.zip"
             
-        filepath = os.path.join(UPLOAD_FOLDER, filename)
-        
-        # Save uploaded file
-        file.save(filepath)
+        filepath = os.path.join(UPLOAD_FOLDER_ABS, filename)
         
-        # Get file size
-        file_size = os.path.getsize(filepath)
+        # Save uploaded file; the size and checksum are computed while copying
+        file_size, sha256 = save_upload(file, filepath)
         
         # Create version info
         version_info = {
@@ -940,828 +1433,178 @@ def upload_game_version():
             'release_notes': release_notes,
             'file_size': file_size,
             'release_date': datetime.utcnow().isoformat(),
-            'is_active': True  # New uploads are active by default
+            'is_active': True,  # New uploads are active by default
+            'sha256': sha256
         }
         
         if upload_type == 'launcher':
-            # Handle launcher versions
-            launcher_versions = load_launcher_versions()
-            
-            # Remove existing version if it exists
-            launcher_versions = [v for v in launcher_versions if v['version'] != version]
-            
-            # Deactivate all other versions
-            for v in launcher_versions:
-                v['is_active'] = False
-            
-            # Add new version
-            launcher_versions.append(version_info)
-            
-            # Save launcher versions
-            save_launcher_versions(launcher_versions)
+            # Handle launcher versions; replaces any existing entry and deactivates the rest
+            save_version('launcher', version_info)
             
             return jsonify({
                 'message': 'Launcher version uploaded successfully',
                 'version': version,
                 'file_size': file_size,
-                'file_size_formatted': format_file_size(file_size)
+                'file_size_formatted': format_file_size(file_size),
+                'sha256': sha256
             })
         else:
-            # Handle game versions (existing logic)
-            versions = load_versions()
-            
-            # Remove existing version if it exists
-            versions = [v for v in versions if v['version'] != version]
-            
-            # Deactivate all other versions
-            for v in versions:
-                v['is_active'] = False
-            
-            # Add new version
-            versions.append(version_info)
-            
-            # Save versions
-            save_versions(versions)
+            # Handle game versions; replaces any existing entry and deactivates the rest
+            save_version('game', version_info)
             
             return jsonify({
                 'message': 'Game version uploaded successfully',
                 'version': version,
                 'file_size': file_size,
-                'file_size_formatted': format_file_size(file_size)
+                'file_size_formatted': format_file_size(file_size),
+                'sha256': sha256
             })
     
     except Exception as e:
         return jsonify({'error': f'Error uploading version: {str(e)}'}), 500
 
-@app.route('/api/version/<version>/activate', methods=['POST'])
-def activate_version(version):
-    """Activate a specific version"""
-    try:
-        versions = load_versions()
-        target_version = None
-        
-        # Find the target version
-        for v in versions:
-            if v['version'] == version:
-                target_version = v
-                break
-        
-        if not target_version:
-            return jsonify({'error': f'Version {version} not found'}), 404
-        
-        # Deactivate all versions
-        for v in versions:
-            v['is_active'] = False
-        
-        # Activate target version
-        target_version['is_active'] = True
-        
-        save_versions(versions)
-        
-        return jsonify({'message': f'Version {version} activated successfully'})
-    
-    except Exception as e:
-        return jsonify({'error': f'Error activating version: {str(e)}'}), 500
+# Game and launcher versions share the activate/delete handlers; labels keep the messages distinct
+_KIND_LABELS = {'game': 'Version', 'launcher': 'Launcher version'}
 
-@app.route('/api/launcher/version/<version>/activate', methods=['POST'])
-def activate_launcher_version(version):
-    """Activate a specific launcher version"""
+@app.route('/api/version/<version>/activate', methods=['POST'], defaults={'kind': 'game'})
+@app.route('/api/launcher/version/<version>/activate', methods=['POST'], defaults={'kind': 'launcher'})
+def activate_version(version, kind):
+    """Activate a specific game or launcher version"""
+    label = _KIND_LABELS[kind]
     try:
-        launcher_versions = load_launcher_versions()
-        target_version = None
-        
-        # Find the target version
-        for v in launcher_versions:
-            if v['version'] == version:
-                target_version = v
-                break
-        
-        if not target_version:
-            return jsonify({'error': f'Launcher version {version} not found'}), 404
-        
-        # Deactivate all versions
-        for v in launcher_versions:
-            v['is_active'] = False
-        
-        # Activate target version
-        target_version['is_active'] = True
+        if not set_active_version(kind, version):
+            return jsonify({'error': f'{label} {version} not found'}), 404
         
-        save_launcher_versions(launcher_versions)
-        
-        return jsonify({'message': f'Launcher version {version} activated successfully'})
+        return jsonify({'message': f'{label} {version} activated successfully'})
     
     except Exception as e:
-        return jsonify({'error': f'Error activating launcher version: {str(e)}'}), 500
+        return jsonify({'error': f'Error activating {label.lower()}: {str(e)}'}), 500
 
-@app.route('/api/version/<version>', methods=['DELETE'])
-def delete_version(version):
-    """Delete a specific version"""
+@app.route('/api/version/<version>', methods=['DELETE'], defaults={'kind': 'game'})
+@app.route('/api/launcher/version/<version>', methods=['DELETE'], defaults={'kind': 'launcher'})
+def delete_version(version, kind):
+    """Delete a specific game or launcher version"""
+    label = _KIND_LABELS[kind]
     try:
-        versions = load_versions()
-        target_version = None
-        
-        # Find the target version
-        for v in versions:
-            if v['version'] == version:
-                target_version = v
-                break
+        target_version = get_version(kind, version)
         
         if not target_version:
-            return jsonify({'error': f'Version {version} not found'}), 404
+            return jsonify({'error': f'{label} {version} not found'}), 404
         
         # Don't allow deleting active version
         if target_version.get('is_active', False):
-            return jsonify({'error': 'Cannot delete active version. Activate another version first.'}), 400
+            return jsonify({'error': f'Cannot delete active {label.lower()}. Activate another version first.'}), 400
         
         # Remove file
         filename = target_version['download_url']
-        filepath = os.path.join(UPLOAD_FOLDER, filename)
+        filepath = os.path.join(UPLOAD_FOLDER_ABS, filename)
         if os.path.exists(filepath):
             os.remove(filepath)
         
-        # Remove from versions list
-        versions = [v for v in versions if v['version'] != version]
-        save_versions(versions)
+        # Remove from the registry
+        remove_version(kind, version)
         
-        return jsonify({'message': f'Version {version} deleted successfully'})
+        return jsonify({'message': f'{label} {version} deleted successfully'})
     
     except Exception as e:
-        return jsonify({'error': f'Error deleting version: {str(e)}'}), 500
+        return jsonify({'error': f'Error deleting {label.lower()}: {str(e)}'}), 500
 
-@app.route('/api/launcher/version/<version>', methods=['DELETE'])
-def delete_launcher_version(version):
-    """Delete a specific launcher version"""
-    try:
-        launcher_versions = load_launcher_versions()
-        target_version = None
-        
-        # Find the target version
-        for v in launcher_versions:
-            if v['version'] == version:
-                target_version = v
-                break
-        
-        if not target_version:
-            return jsonify({'error': f'Launcher version {version} not found'}), 404
-        
-        # Don't allow deleting active version
-        if target_version.get('is_active', False):
-            return jsonify({'error': 'Cannot delete active launcher version. Activate another version first.'}), 400
-        
-        # Remove file
-        filename = target_version['download_url']
-        filepath = os.path.join(UPLOAD_FOLDER, filename)
-        if os.path.exists(filepath):
-            os.remove(filepath)
-        
-        # Remove from versions list
-        launcher_versions = [v for v in launcher_versions if v['version'] != version]
-        save_launcher_versions(launcher_versions)
-        
-        return jsonify({'message': f'Launcher version {version} deleted successfully'})
-    
-    except Exception as e:
-        return jsonify({'error': f'Error deleting launcher version: {str(e)}'}), 500
+# Health probes arrive every few seconds per replica, so bodies are serialized ahead of
+# time; the /api/health one is rebuilt at most once per second: (epoch_second, body)
+_health_check_body = (None, b'')
+_HEALTH_BODY = orjson.dumps({'status': 'healthy'}, option=orjson.OPT_APPEND_NEWLINE)
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
-    return jsonify({
-        'status': 'Healthy',
-        'timestamp': datetime.utcnow().isoformat(),
-        'version': '1.0.0'
-    })
+    global _health_check_body
+    now = int(time.time())
+    if _health_check_body[0] != now:
+        timestamp = datetime.fromtimestamp(now, timezone.utc).replace(tzinfo=None).isoformat()
+        _health_check_body = (now, app.json.dumps_bytes({
+            'status': 'Healthy',
+            'timestamp': timestamp,
+            'version': '1.0.0'
+        }))
+    return app.response_class(_health_check_body[1], mimetype=app.json.mimetype)
 
 # Simple health endpoint for Docker
 @app.route('/health')
 def health():
     """Simple health check endpoint for Docker"""
-    return {'status': 'healthy'}, 200
+    return app.response_class(_HEALTH_BODY, mimetype=app.json.mimetype)
 
 # Static file serving
 @app.route('/downloads/<filename>')
 def download_file(filename):
     """Serve download files"""
-    return send_from_directory(UPLOAD_FOLDER, filename)
+    if ACCEL_REDIRECT_PREFIX:
+        # Let nginx stream the file with sendfile(2); Python only validates the name
+        filepath = safe_join(UPLOAD_FOLDER_ABS, filename)
+        if filepath is None or not os.path.isfile(filepath):
+            abort(404)
+        response = Response(mimetype='application/zip')
+        response.headers['X-Accel-Redirect'] = ACCEL_REDIRECT_PREFIX + quote(filename)
+        return response
+    
+    return send_from_directory(UPLOAD_FOLDER_ABS, filename)
+
+# Admin interface; the page is static and reads the signed-in user from /api/me,
+# so its bytes are loaded and compressed once and served without re-encoding: (html, gzipped_html)
+with open(os.path.join(app.static_folder, 'admin.html'), 'rb') as f:
+    ADMIN_HTML = f.read()
+_ADMIN_PAGE = (ADMIN_HTML, gzip.compress(ADMIN_HTML, 9))
+# Weak, since the plain and gzipped bodies share it; changes only when the file does
+_ADMIN_ETAG = hashlib.blake2b(ADMIN_HTML, digest_size=8).hexdigest()
 
-# Admin interface
 @app.route('/admin')
 @login_required
 def admin_interface():
     """Admin web interface"""
-    admin_html = '''
-<!DOCTYPE html>
-<html>
-<head>
-    <title>Game Update Server Admin</title>
-    <style>
-        body { font-family: Arial, sans-serif; margin: 40px; background: #f5f5f5; }
-        .container { background: white; padding: 20px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); max-width: 1200px; margin: 0 auto; }
-        .header { display: flex; justify-content: space-between; align-items: center; margin-bottom: 20px; border-bottom: 2px solid #e9ecef; padding-bottom: 15px; }
-        .user-info { display: flex; align-items: center; gap: 10px; }
-        .user-info span { color: #666; font-weight: bold; }
-        .upload-form { background: #f8f9fa; padding: 20px; border-radius: 5px; margin: 20px 0; }
-        .version-list { margin: 20px 0; }
-        .version-item { 
-            background: white; 
-            padding: 15px; 
-            margin: 10px 0; 
-            border-radius: 5px; 
-            border-left: 4px solid #007bff;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-        }
-        .active { border-left-color: #28a745; background: #f8fff9; }
-        .btn { 
-            padding: 8px 16px; 
-            border: none; 
-            border-radius: 4px; 
-            cursor: pointer; 
-            margin: 0 5px;
-            text-decoration: none;
-            display: inline-block;
-            font-size: 12px;
-        }
-        .btn-primary { background: #007bff; color: white; }
-        .btn-success { background: #28a745; color: white; }
-        .btn-danger { background: #dc3545; color: white; }
-        .btn:hover { opacity: 0.8; }
-        input, textarea, select { width: 100%; padding: 8px; margin: 5px 0; border: 1px solid #ddd; border-radius: 4px; box-sizing: border-box; }
-        .file-input { width: auto; }
-        .status { padding: 10px; margin: 10px 0; border-radius: 4px; }
-        .status.success { background: #d4edda; border: 1px solid #c3e6cb; color: #155724; }
-        .status.error { background: #f8d7da; border: 1px solid #f5c6cb; color: #721c24; }
-        .loading { display: none; text-align: center; padding: 20px; }
-        .progress { 
-            width: 100%; 
-            height: 30px;
-            background: #f0f0f0; 
-            border-radius: 15px; 
-            overflow: hidden; 
-            margin: 10px 0; 
-            position: relative;
-            border: 1px solid #ddd;
-        }
-        .progress-bar { 
-            height: 100%; 
-            background: linear-gradient(90deg, #007bff, #0056b3);
-            width: 0%; 
-            transition: width 0.3s;
-            position: relative;
-            overflow: visible;
-        }
-        .progress-text {
-            position: absolute;
-            top: 50%;
-            left: 50%;
-            transform: translate(-50%, -50%);
-            color: #333;
-            font-weight: bold;
-            font-size: 14px;
-            z-index: 10;
-            text-shadow: 0 0 3px rgba(255,255,255,0.5);
-        }
-        .upload-stats {
-            margin-top: 10px;
-            font-size: 12px;
-            color: #666;
-            display: none;
-        }
-        .upload-stats.active {
-            display: block;
-        }
-        .tabs { display: flex; margin-bottom: 20px; border-bottom: 2px solid #e9ecef; }
-        .tab { padding: 10px 20px; cursor: pointer; border-bottom: 2px solid transparent; margin-right: 10px; }
-        .tab.active { border-bottom-color: #007bff; background: #f8f9fa; }
-        .tab-content { display: none; }
-        .tab-content.active { display: block; }
-        .inline-form { display: flex; gap: 10px; align-items: end; }
-        .inline-form > div { flex: 1; }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🎮 Game Update Server Admin</h1>
-            <div class="user-info">
-                <span>👤 {{ session.username }}</span>
-                <a href="{{ url_for('manage_users') }}" class="btn btn-primary">👥 Users</a>
-                <a href="{{ url_for('logout') }}" class="btn btn-danger">🚪 Logout</a>
-            </div>
-        </div>
-        
-        <div id="status"></div>
-        
-        <!-- Tabs -->
-        <div class="tabs">
-            <div class="tab active" onclick="showTab('game')">🎮 Game Versions</div>
-            <div class="tab" onclick="showTab('launcher')">🚀 Launcher Versions</div>
-        </div>
-        
-        <!-- Game Tab -->
-        <div id="game-tab" class="tab-content active">
-            <div class="upload-form">
-                <h3>📦 Upload New Game Version</h3>
-                <form id="uploadGameForm" enctype="multipart/form-data">
-                    <div class="inline-form">
-                        <div>
-                            <label><strong>Version:</strong></label>
-                            <input type="text" id="gameVersion" name="version" placeholder="e.g., 1.2.3" required>
-                        </div>
-                        <div>
-                            <label><strong>Game File (ZIP):</strong></label>
-                            <input type="file" id="gameFile" name="game_file" accept=".zip" class="file-input" required>
-                        </div>
-                        <div>
-                            <label>&nbsp;</label>
-                            <button type="submit" class="btn btn-primary" id="uploadGameBtn">Upload Game</button>
-                        </div>
-                    </div>
-                    
-                    <label><strong>Release Notes:</strong></label>
-                    <textarea id="gameReleaseNotes" name="release_notes" placeholder="What's new in this version..." rows="3"></textarea>
-                    
-                    <input type="hidden" name="upload_type" value="game">
-                    
-                    <div class="progress" id="gameUploadProgress" style="display: none;">
-                        <div class="progress-bar" id="gameProgressBar"></div>
-                        <div class="progress-text" id="gameProgressText">0%</div>
-                    </div>
-                    <div class="upload-stats" id="gameUploadStats">
-                        <span id="gameUploadedSize">0 MB</span> / <span id="gameTotalSize">0 MB</span> uploaded
-                        • <span id="gameUploadSpeed">0 MB/s</span>
-                        • <span id="gameTimeRemaining">calculating...</span> remaining
-                    </div>
-                </form>
-            </div>
-            
-            <div class="version-list">
-                <h3>📋 Game Versions</h3>
-                <div class="loading" id="gameLoading">Loading game versions...</div>
-                <div id="gameVersions"></div>
-            </div>
-        </div>
-        
-        <!-- Launcher Tab -->
-        <div id="launcher-tab" class="tab-content">
-            <div class="upload-form">
-                <h3>🚀 Upload New Launcher Version</h3>
-                <form id="uploadLauncherForm" enctype="multipart/form-data">
-                    <div class="inline-form">
-                        <div>
-                            <label><strong>Version:</strong></label>
-                            <input type="text" id="launcherVersion" name="version" placeholder="e.g., 2.1.0" required>
-                        </div>
-                        <div>
-                            <label><strong>Launcher File (ZIP):</strong></label>
-                            <input type="file" id="launcherFile" name="game_file" accept=".zip" class="file-input" required>
-                        </div>
-                        <div>
-                            <label>&nbsp;</label>
-                            <button type="submit" class="btn btn-primary" id="uploadLauncherBtn">Upload Launcher</button>
-                        </div>
-                    </div>
-                    
-                    <label><strong>Release Notes:</strong></label>
-                    <textarea id="launcherReleaseNotes" name="release_notes" placeholder="What's new in this launcher version..." rows="3"></textarea>
-                    
-                    <input type="hidden" name="upload_type" value="launcher">
-                    
-                    <div class="progress" id="launcherUploadProgress" style="display: none;">
-                        <div class="progress-bar" id="launcherProgressBar"></div>
-                        <div class="progress-text" id="launcherProgressText">0%</div>
-                    </div>
-                    <div class="upload-stats" id="launcherUploadStats">
-                        <span id="launcherUploadedSize">0 MB</span> / <span id="launcherTotalSize">0 MB</span> uploaded
-                        • <span id="launcherUploadSpeed">0 MB/s</span>
-                        • <span id="launcherTimeRemaining">calculating...</span> remaining
-                    </div>
-                </form>
-            </div>
-            
-            <div class="version-list">
-                <h3>🚀 Launcher Versions</h3>
-                <div class="loading" id="launcherLoading">Loading launcher versions...</div>
-                <div id="launcherVersions"></div>
-            </div>
-        </div>
-    </div>
-
-    <script>
-        // Tab functionality
-        function showTab(tabName) {
-            // Hide all tab contents
-            document.querySelectorAll('.tab-content').forEach(content => {
-                content.classList.remove('active');
-            });
-            
-            // Remove active class from all tabs
-            document.querySelectorAll('.tab').forEach(tab => {
-                tab.classList.remove('active');
-            });
-            
-            // Show selected tab content
-            document.getElementById(tabName + '-tab').classList.add('active');
-            
-            // Add active class to clicked tab
-            event.target.classList.add('active');
-            
-            // Load versions for the selected tab
-            if (tabName === 'game') {
-                loadGameVersions();
-            } else {
-                loadLauncherVersions();
-            }
-        }
-
-        // Load versions on page load
-        loadGameVersions();
-        loadLauncherVersions();
-
-        // Game upload form handler
-        document.getElementById('uploadGameForm').addEventListener('submit', async (e) => {
-            e.preventDefault();
-            uploadVersion('game');
-        });
-        
-        // Launcher upload form handler
-        document.getElementById('uploadLauncherForm').addEventListener('submit', async (e) => {
-            e.preventDefault();
-            uploadVersion('launcher');
-        });
-
-        async function uploadVersion(type) {
-            const formId = type === 'game' ? 'uploadGameForm' : 'uploadLauncherForm';
-            const btnId = type === 'game' ? 'uploadGameBtn' : 'uploadLauncherBtn';
-            const progressId = type === 'game' ? 'gameUploadProgress' : 'launcherUploadProgress';
-            const progressBarId = type === 'game' ? 'gameProgressBar' : 'launcherProgressBar';
-            const progressTextId = type === 'game' ? 'gameProgressText' : 'launcherProgressText';
-            const uploadStatsId = type === 'game' ? 'gameUploadStats' : 'launcherUploadStats';
-            
-            const form = document.getElementById(formId);
-            const uploadBtn = document.getElementById(btnId);
-            const progressDiv = document.getElementById(progressId);
-            const progressBar = document.getElementById(progressBarId);
-            const progressText = document.getElementById(progressTextId);
-            const uploadStats = document.getElementById(uploadStatsId);
-            
-            const formData = new FormData(form);
-            
-            // Get file size for display
-            const fileInput = type === 'game' ? document.getElementById('gameFile') : document.getElementById('launcherFile');
-            const file = fileInput.files[0];
-            const totalSize = file.size;
-            
-            uploadBtn.disabled = true;
-            uploadBtn.textContent = 'Uploading...';
-            progressDiv.style.display = 'block';
-            uploadStats.classList.add('active');
-            
-            // Upload tracking variables
-            let startTime = Date.now();
-            let lastLoaded = 0;
-            let lastTime = startTime;
-            
-            const xhr = new XMLHttpRequest();
-            
-            // Set timeout to prevent hanging (10 minutes for large files)
-            xhr.timeout = 600000;
-            
-            // Track upload progress
-            xhr.upload.addEventListener('progress', (e) => {
-                if (e.lengthComputable) {
-                    const percentComplete = Math.round((e.loaded / e.total) * 100);
-                    const currentTime = Date.now();
-                    const elapsedTime = (currentTime - startTime) / 1000; // in seconds
-                    
-                    // Update progress bar
-                    progressBar.style.width = percentComplete + '%';
-                    progressText.textContent = percentComplete + '%';
-                    
-                    // Calculate upload speed (using recent speed, not average)
-                    const timeDelta = (currentTime - lastTime) / 1000;
-                    const bytesDelta = e.loaded - lastLoaded;
-                    let mbPerSecond = 0;
-                    
-                    if (timeDelta > 0) {
-                        mbPerSecond = ((bytesDelta / timeDelta) / (1024 * 1024)).toFixed(2);
-                    } else {
-                        // Fallback to average speed
-                        const bytesPerSecond = e.loaded / elapsedTime;
-                        mbPerSecond = (bytesPerSecond / (1024 * 1024)).toFixed(2);
-                    }
-                    
-                    // Update last values for next calculation
-                    lastTime = currentTime;
-                    lastLoaded = e.loaded;
-                    
-                    // Calculate time remaining based on current speed
-                    const bytesRemaining = e.total - e.loaded;
-                    const bytesPerSec = mbPerSecond * 1024 * 1024;
-                    const secondsRemaining = bytesPerSec > 0 ? Math.round(bytesRemaining / bytesPerSec) : 0;
-                    const timeRemaining = formatTime(secondsRemaining);
-                    
-                    // Update stats display
-                    const prefix = type === 'game' ? 'game' : 'launcher';
-                    document.getElementById(prefix + 'UploadedSize').textContent = formatBytes(e.loaded);
-                    document.getElementById(prefix + 'TotalSize').textContent = formatBytes(e.total);
-                    document.getElementById(prefix + 'UploadSpeed').textContent = mbPerSecond + ' MB/s';
-                    document.getElementById(prefix + 'TimeRemaining').textContent = timeRemaining;
-                    
-                    // Change color as upload progresses
-                    if (percentComplete < 50) {
-                        progressBar.style.background = 'linear-gradient(90deg, #dc3545, #fd7e14)';
-                    } else if (percentComplete < 80) {
-                        progressBar.style.background = 'linear-gradient(90deg, #ffc107, #28a745)';
-                    } else {
-                        progressBar.style.background = 'linear-gradient(90deg, #28a745, #20c997)';
-                    }
-                    
-                    // Log progress to console for debugging
-                    console.log(`Upload progress: ${percentComplete}% (${formatBytes(e.loaded)} / ${formatBytes(e.total)})`);
-                }
-            });
-            
-            // Handle successful upload
-            xhr.onload = function() {
-                if (xhr.status === 200) {
-                    try {
-                        const response = JSON.parse(xhr.responseText);
-                        progressText.textContent = 'Complete!';
-                        progressBar.style.width = '100%';
-                        progressBar.style.background = 'linear-gradient(90deg, #28a745, #20c997)';
-                        showStatus(`✅ ${type === 'game' ? 'Game' : 'Launcher'} version uploaded successfully!`, 'success');
-                        form.reset();
-                        
-                        // Reload versions after a short delay
-                        setTimeout(() => {
-                            if (type === 'game') {
-                                loadGameVersions();
-                            } else {
-                                loadLauncherVersions();
-                            }
-                            // Reset upload UI only after success
-                            uploadBtn.disabled = false;
-                            uploadBtn.textContent = type === 'game' ? 'Upload Game' : 'Upload Launcher';
-                            progressDiv.style.display = 'none';
-                            uploadStats.classList.remove('active');
-                            progressBar.style.width = '0%';
-                            progressText.textContent = '0%';
-                        }, 2000);
-                    } catch (e) {
-                        showStatus('❌ Upload completed but response was invalid', 'error');
-                        console.error('Response parsing error:', e);
-                        resetUploadUI();
-                    }
-                } else {
-                    try {
-                        const error = JSON.parse(xhr.responseText);
-                        showStatus('❌ Upload failed: ' + error.error, 'error');
-                    } catch (e) {
-                        showStatus('❌ Upload failed with status: ' + xhr.status, 'error');
-                    }
-                    resetUploadUI();
-                }
-            };
-            
-            // Handle upload errors
-            xhr.onerror = function() {
-                console.error('Upload error occurred');
-                showStatus('❌ Upload failed: Network error or connection lost', 'error');
-                resetUploadUI();
-            };
-            
-            // Handle timeout
-            xhr.ontimeout = function() {
-                console.error('Upload timeout');
-                showStatus('❌ Upload failed: Request timed out', 'error');
-                resetUploadUI();
-            };
-            
-            // Handle abort
-            xhr.onabort = function() {
-                console.log('Upload aborted');
-                showStatus('⚠️ Upload cancelled', 'error');
-                resetUploadUI();
-            };
-            
-            // Reset UI function
-            function resetUploadUI() {
-                setTimeout(() => {
-                    uploadBtn.disabled = false;
-                    uploadBtn.textContent = type === 'game' ? 'Upload Game' : 'Upload Launcher';
-                    progressDiv.style.display = 'none';
-                    uploadStats.classList.remove('active');
-                    progressBar.style.width = '0%';
-                    progressText.textContent = '0%';
-                }, 1000);
-            }
-            
-            // Start the upload
-            try {
-                xhr.open('POST', '/api/upload');
-                // Don't set Content-Type, let browser set it with boundary for multipart/form-data
-                xhr.send(formData);
-                console.log(`Starting upload of ${formatBytes(totalSize)} file`);
-            } catch (error) {
-                console.error('Failed to start upload:', error);
-                showStatus('❌ Failed to start upload: ' + error.message, 'error');
-                resetUploadUI();
-            }
-        }
-
-        // Helper function to format bytes
-        function formatBytes(bytes) {
-            if (bytes >= 1024 * 1024 * 1024) return (bytes / (1024 * 1024 * 1024)).toFixed(2) + ' GB';
-            if (bytes >= 1024 * 1024) return (bytes / (1024 * 1024)).toFixed(2) + ' MB';
-            if (bytes >= 1024) return (bytes / 1024).toFixed(2) + ' KB';
-            return bytes + ' B';
-        }
-
-        // Helper function to format time
-        function formatTime(seconds) {
-            if (seconds < 60) return seconds + ' seconds';
-            if (seconds < 3600) return Math.floor(seconds / 60) + ' min ' + (seconds % 60) + ' sec';
-            const hours = Math.floor(seconds / 3600);
-            const minutes = Math.floor((seconds % 3600) / 60);
-            return hours + ' hr ' + minutes + ' min';
-        }
-
-        async function loadGameVersions() {
-            const loading = document.getElementById('gameLoading');
-            const versionsDiv = document.getElementById('gameVersions');
-            
-            loading.style.display = 'block';
-            versionsDiv.innerHTML = '';
-            
-            try {
-                const response = await fetch('/api/version/history');
-                const versions = await response.json();
-                
-                loading.style.display = 'none';
-                
-                if (versions.length === 0) {
-                    versionsDiv.innerHTML = '<p>🔭 No game versions uploaded yet.</p>';
-                    return;
-                }
-                
-                renderVersions(versions, versionsDiv, 'game');
-                
-            } catch (error) {
-                loading.style.display = 'none';
-                showStatus('❌ Failed to load game versions: ' + error.message, 'error');
-            }
-        }
-        
-        async function loadLauncherVersions() {
-            const loading = document.getElementById('launcherLoading');
-            const versionsDiv = document.getElementById('launcherVersions');
-            
-            loading.style.display = 'block';
-            versionsDiv.innerHTML = '';
-            
-            try {
-                const response = await fetch('/api/launcher/history');
-                let versions = [];
-                
-                if (response.ok) {
-                    versions = await response.json();
-                }
-                
-                loading.style.display = 'none';
-                
-                if (versions.length === 0) {
-                    versionsDiv.innerHTML = '<p>🔭 No launcher versions uploaded yet.</p>';
-                    return;
-                }
-                
-                renderVersions(versions, versionsDiv, 'launcher');
-                
-            } catch (error) {
-                loading.style.display = 'none';
-                showStatus('❌ Failed to load launcher versions: ' + error.message, 'error');
-            }
-        }
-        
-        function renderVersions(versions, container, type) {
-            versions.forEach(version => {
-                const versionDiv = document.createElement('div');
-                versionDiv.className = 'version-item' + (version.is_active ? ' active' : '');
-                
-                const fileSize = formatFileSize(version.file_size || 0);
-                const releaseDate = new Date(version.release_date).toLocaleString();
-                const icon = type === 'game' ? '🎮' : '🚀';
-                
-                versionDiv.innerHTML = `
-                    <div>
-                        <strong>${icon} v${version.version}</strong> ${version.is_active ? '<span style="color: #28a745;">●</span> Active' : '<span style="color: #6c757d;">○</span> Inactive'}
-                        <br>
-                        <small>📅 Released: ${releaseDate} | 💾 Size: ${fileSize}</small>
-                        <br>
-                        <small>📝 ${version.release_notes || 'No release notes provided'}</small>
-                    </div>
-                    <div>
-                        ${!version.is_active ? `<button class="btn btn-success" onclick="activateVersion('${version.version}', '${type}')">✅ Activate</button>` : ''}
-                        <button class="btn btn-danger" onclick="deleteVersion('${version.version}', '${type}')" ${version.is_active ? 'style="background: #6c757d;" title="Deactivate first to delete"' : ''}>🗑️ Delete</button>
-                    </div>
-                `;
-                
-                container.appendChild(versionDiv);
-            });
-        }
-
-        async function activateVersion(version, type) {
-            if (confirm(`Activate ${type} version ${version}? This will make it the current version for all clients.`)) {
-                try {
-                    const endpoint = type === 'game' ? `/api/version/${version}/activate` : `/api/launcher/version/${version}/activate`;
-                    const response = await fetch(endpoint, { method: 'POST' });
-                    const result = await response.json();
-                    
-                    if (response.ok) {
-                        showStatus(`✅ ${type === 'game' ? 'Game' : 'Launcher'} version ${version} activated successfully!`, 'success');
-                        if (type === 'game') {
-                            loadGameVersions();
-                        } else {
-                            loadLauncherVersions();
-                        }
-                    } else {
-                        showStatus('❌ Failed to activate version: ' + result.error, 'error');
-                    }
-                } catch (error) {
-                    showStatus('❌ Error: ' + error.message, 'error');
-                }
-            }
-        }
-
-        async function deleteVersion(version, type) {
-            if (confirm(`Delete ${type} version ${version}? This action cannot be undone.`)) {
-                try {
-                    const endpoint = type === 'game' ? `/api/version/${version}` : `/api/launcher/version/${version}`;
-                    const response = await fetch(endpoint, { method: 'DELETE' });
-                    const result = await response.json();
-                    
-                    if (response.ok) {
-                        showStatus(`✅ ${type === 'game' ? 'Game' : 'Launcher'} version ${version} deleted successfully!`, 'success');
-                        if (type === 'game') {
-                            loadGameVersions();
-                        } else {
-                            loadLauncherVersions();
-                        }
-                    } else {
-                        showStatus('❌ Failed to delete version: ' + result.error, 'error');
-                    }
-                } catch (error) {
-                    showStatus('❌ Error: ' + error.message, 'error');
-                }
-            }
-        }
+    # Browsers revalidate on each visit and get a bodiless 304 until a deploy changes the page
+    if request.if_none_match.contains_weak(_ADMIN_ETAG):
+        response = Response(status=304)
+        response.vary.add('Accept-Encoding')
+    else:
+        response = html_response(*_ADMIN_PAGE)
+    response.set_etag(_ADMIN_ETAG, weak=True)
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
 
-        function formatFileSize(bytes) {
-            if (bytes >= 1024 * 1024 * 1024) return (bytes / (1024 * 1024 * 1024)).toFixed(1) + ' GB';
-            if (bytes >= 1024 * 1024) return (bytes / (1024 * 1024)).toFixed(1) + ' MB';
-            if (bytes >= 1024) return (bytes / 1024).toFixed(1) + ' KB';
-            return bytes + ' bytes';
-        }
+@app.route('/api/me', methods=['GET'])
+@login_required
+def current_user():
+    """Get the signed-in admin user"""
+    return jsonify({'user_id': session['user_id'], 'username': session['username']})
 
-        function showStatus(message, type) {
-            const statusDiv = document.getElementById('status');
-            statusDiv.innerHTML = `<div class="status ${type}">${message}</div>`;
-            
-            // Auto-hide success messages after 5 seconds
-            if (type === 'success') {
-                setTimeout(() => {
-                    statusDiv.innerHTML = '';
-                }, 5000);
-            }
-        }
-    </script>
-</body>
-</html>
-    '''
-    
-    return render_template_string(admin_html)
+# Initialize database on import so every WSGI worker sees the schema
+init_database()
 
 if __name__ == '__main__':
-    # Initialize database on startup
-    init_database()
-    
-    # Get configuration from environment
-    debug_mode = os.getenv('FLASK_DEBUG', 'False').lower() == 'true'
-    port = int(os.getenv('PORT', 5000))
-    
-    if debug_mode:
-        print("🚀 Starting Game Update Server...")
-        print(f"🌐 Launcher Download: http://localhost:{port}/")
-        print(f"📊 Admin Interface: http://localhost:{port}/admin")
-        print(f"🔑 Default Login: admin/admin123")
-        print(f"🔗 API Endpoint: http://localhost:{port}/api/version")
-        print(f"🚀 Launcher API: http://localhost:{port}/api/launcher/version")
-        print(f"💾 Downloads folder: {os.path.abspath(UPLOAD_FOLDER)}")
-        print(f"📁 Data folder: {os.path.abspath(DATA_FOLDER)}")
-    
-    app.run(host='0.0.0.0', port=port, debug=debug_mode)
+    if DEBUG_MODE:
+        # One write for the whole banner instead of a print() per line
+        print(
+            "🚀 Starting Game Update Server...\n"
+            f"🌐 Launcher Download: http://localhost:{PORT}/\n"
+            f"📊 Admin Interface: http://localhost:{PORT}/admin\n"
+            "🔑 Default Login: admin/admin123\n"
+            f"🔗 API Endpoint: http://localhost:{PORT}/api/version\n"
+            f"🚀 Launcher API: http://localhost:{PORT}/api/launcher/version\n"
+            f"💾 Downloads folder: {UPLOAD_FOLDER_ABS}\n"
+            f"📁 Data folder: {DATA_FOLDER_ABS}"
+        )
+        app.run(host='0.0.0.0', port=PORT, debug=True)
+    else:
+        # Outside debug mode, replace this process with gunicorn (see gunicorn.conf.py)
+        # rather than serving through Werkzeug's development server
+        app_dir = os.path.dirname(os.path.abspath(__file__))
+        try:
+            os.execvp('gunicorn', ['gunicorn', '--config', os.path.join(app_dir, 'gunicorn.conf.py'),
+                                   '--pythonpath', app_dir, '--bind', f'0.0.0.0:{PORT}', 'server:app'])
+        except FileNotFoundError:
+            print("⚠️ gunicorn not found, falling back to the development server")
+            app.run(host='0.0.0.0', port=PORT, debug=False)
 
 
 